@@ -13,10 +13,11 @@ def add_global_arguments(
     BaseCommand.init_log_file(parser)
     BaseCommand.init_log_levels(parser)
 
-    if hasattr(parser, "_command"):
-        getattr(parser, "_command").init_formatters(parser)
-    elif main_parser and hasattr(main_parser, "_command"):
-        getattr(main_parser, "_command").init_formatters(parser)
+    command = getattr(parser, "_command", None)
+    if command is None and main_parser is not None:
+        command = getattr(main_parser, "_command", None)
+    if command is not None:
+        command.init_formatters(parser)
     if add_help:
         parser.add_argument(
             "-h",
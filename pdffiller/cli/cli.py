@@ -45,12 +45,19 @@ class Cli:
         self._commands: Dict[str, Any] = {}
         init_colorama(sys.stderr)
 
-    def _add_commands(self) -> None:
+    def _add_commands(self, name: Optional[str] = None) -> None:
+        """Register the available commands.
+
+        :param name: Optional command name. When given, only the matching command
+                     module is imported, else all command modules are loaded.
+        """
         pdffiller_commands_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)), "commands"
         )
         for module in pkgutil.iter_modules([pdffiller_commands_path]):
             module_name = module[1]
+            if module_name in self._commands or (name is not None and module_name != name):
+                continue
             self._add_command(f"pdffiller.cli.commands.{module_name}", module_name)
 
     def _add_command(
@@ -119,14 +126,12 @@ class Cli:
 
                 # Help will be all the lines up to the first empty one
                 docstring_lines = self._commands[name].doc.split("\n")
-                start = False
                 data: List[str] = []
                 for line in docstring_lines:
                     line = line.strip()
                     if not line:
-                        if start:
+                        if data:
                             break
-                        start = True
                         continue
                     data.append(line)
 
@@ -141,13 +146,14 @@ class Cli:
         methods
         """
         output = PdfFillerOutput()
-        self._add_commands()
         try:
             command_argument = args[0][0]
         except IndexError:  # No parameters
+            self._add_commands()
             self._output_help_cli()
             raise InvalidCommandNameException(None)  # pylint: disable=raise-missing-from
 
+        self._add_commands(command_argument)
         try:
             command = self._commands[command_argument]
         except KeyError:  # No parameters
@@ -158,6 +164,7 @@ class Cli:
                 )
                 raise AbortExecution(0)  # pylint: disable=raise-missing-from
 
+            self._add_commands()
             if command_argument in ["-h", "--help"]:
                 self._output_help_cli()
                 raise AbortExecution(0)  # pylint: disable=raise-missing-from
@@ -1,4 +1,5 @@
 import argparse
+import inspect
 
 from pdffiller.cli.once_argument import OnceArgument
 from pdffiller.cli.smart_formatter import SmartFormatter
@@ -12,10 +13,10 @@ from pdffiller.typing import (
     Any,
     Callable,
     Dict,
-    List,
     Optional,
     Sequence,
     SubParserType,
+    Tuple,
     Union,
 )
 
@@ -85,8 +86,16 @@ class BaseCommand:
                     raise PdfFillerException(
                         f"Invalid formatter for {kind}. The formatter must be" "a valid function"
                     )
-        if callback.__doc__:
-            self.callback_doc = callback.__doc__
+        # Formatters that are shown as available in help, 'text' formatter
+        # should not appear
+        self._help_formatters: Tuple[str, ...] = tuple(
+            formatter for formatter in self.formatters if formatter != "text"
+        )
+        self._help_formatters_str = ", ".join(self._help_formatters)
+        self._resolve_formatter: Callable[[str], Optional[FormatterCallback]] = self.formatters.get
+        doc = inspect.getdoc(callback)
+        if doc:
+            self.callback_doc = doc
         else:
             raise PdfFillerException(
                 f"No documentation string defined for command: '{self.callback_name}'."
@@ -121,24 +130,15 @@ class BaseCommand:
             action=OnceArgument,
         )
 
-    @property
-    def _help_formatters(self) -> List[str]:
-        """
-        Formatters that are shown as available in help, 'text' formatter
-        should not appear
-        """
-        return [formatter for formatter in self.formatters if formatter != "text"]
-
     def init_formatters(self, parser: argparse.ArgumentParser) -> None:
         """Add formatters command-line options."""
-        formatters = self._help_formatters
-        if formatters:
+        if self._help_formatters:
             parser.add_argument(
                 "-f",
                 "--format",
                 metavar="NAME",
                 action=OnceArgument,
-                help=f"Select the output format: {', '.join(formatters)}",
+                help=f"Select the output format: {self._help_formatters_str}",
             )
 
     @property
@@ -159,19 +159,13 @@ class BaseCommand:
     def _format(self, parser: argparse.ArgumentParser, info: Dict[str, Any], *args: Any) -> None:
         parser_args, _ = parser.parse_known_args(*args)
 
-        default_format = "text"
-        try:
-            formatarg = parser_args.format or default_format
-        except AttributeError:
-            formatarg = default_format
-
-        try:
-            formatter = self.formatters[formatarg]
-        except KeyError as exc:
+        formatarg = getattr(parser_args, "format", None) or "text"
+        formatter = self._resolve_formatter(formatarg)
+        if formatter is None:
             raise PdfFillerException(
                 f"{formatarg} is not a known format. Supported formatters are: "
-                f"{', '.join(self._help_formatters)}"
-            ) from exc
+                f"{self._help_formatters_str}"
+            )
 
         formatter(info)
 
@@ -197,25 +191,25 @@ class PdfFillerCommand(BaseCommand):
         subcommand.set_name(self.callback_name)
         self.subcommands[subcommand.callback_name] = subcommand
 
-    def _docs(self) -> PdfFillerArgumentParser:
+    def _build_parser(self) -> PdfFillerArgumentParser:
+        """Create the command parser.
+
+        A new parser is needed for each execution as the command callback
+        registers its arguments on the parser it receives.
+        """
         parser = PdfFillerArgumentParser(
             description=self.callback_doc,
             prog=f"pdffiller {self.callback_name}",
             formatter_class=SmartFormatter,
             add_help=False,
         )
+        # pylint: disable=protected-access
+        parser._command = self
         return parser
 
     def run(self, *args: Any) -> None:
         """Parse and execute requested command"""
-        parser = PdfFillerArgumentParser(
-            description=self.callback_doc,
-            prog=f"pdffiller {self.callback_name}",
-            formatter_class=SmartFormatter,
-            add_help=False,
-        )
-        # pylint: disable=protected-access
-        parser._command = self
+        parser = self._build_parser()
         info = self.callback(parser, *args)
 
         if not self.subcommands:
@@ -1,37 +1,34 @@
-import json
-import os
-
 from pdffiller.cli.args import add_global_arguments
 from pdffiller.cli.command import pdffiller_command, PdfFillerArgumentParser
-from pdffiller.exceptions import (
-    AbortExecution,
-    CommandLineError,
-    FileNotExistsError,
-    PdfFillerException,
-)
+from pdffiller.exceptions import AbortExecution, CommandLineError, PdfFillerException
 from pdffiller.io.output import cli_out_write, PdfFillerOutput
 from pdffiller.pdf import Pdf
-from pdffiller.typing import Any
+from pdffiller.typing import Any, List
+from pdffiller.utils import check_file_exists
 
 from ..exit_codes import ERROR_ENCOUNTERED
 
 
 def dump_fields_text_formatter(pdf: Pdf) -> None:
     """Print output text for dump_fields command as simple text"""
+    lines: List[str] = []
+    append = lines.append
     for widget in pdf.schema:
-        cli_out_write("----------")
+        append("----------")
         for key, value in widget.items():
             if isinstance(value, list):
-                for subvalue in value:
-                    cli_out_write(f"{key}: {subvalue}")
+                lines.extend(f"{key}: {subvalue}" for subvalue in value)
             else:
-                cli_out_write(f"{key}: {value}")
+                append(f"{key}: {value}")
+
+    if lines:
+        cli_out_write("\n".join(lines))
 
 
 def dump_fields_json_formatter(pdf: Pdf) -> None:
     """Print output text for dump_fields command as simple text"""
 
-    cli_out_write(json.dumps(pdf.schema, indent=4, ensure_ascii=False))
+    cli_out_write(pdf.schema_json)
 
 
 @pdffiller_command(
@@ -55,21 +52,20 @@ def dump_data_fields(parser: PdfFillerArgumentParser, *args: Any) -> Any:
 
     opts = parser.parse_args(*args)
 
-    output = PdfFillerOutput()
     if not opts.file:
         raise CommandLineError("no input file given")
 
-    if not os.path.isfile(opts.file):
-        raise FileNotExistsError(opts.file)
+    check_file_exists(opts.file)
 
     try:
         pdf = Pdf(opts.file)
         return pdf
     except PdfFillerException as exp:
-        output.error(str(exp))
+        PdfFillerOutput().error(str(exp))
     except Exception as exg:  # pylint: disable=broad-except # pragma: no cover
-        output.error(f"unexpected error when adding {opts.file} with the following error:")
-        output.error(exg)
+        PdfFillerOutput().error(
+            f"unexpected error when adding {opts.file} with the following error:"
+        ).error(exg)
         raise AbortExecution(ERROR_ENCOUNTERED) from exg
 
     return None
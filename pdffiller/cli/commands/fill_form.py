@@ -1,27 +1,73 @@
-import html
-import json
+import functools
 import os
 import sys
 
-import yaml
-
 from pdffiller.cli.args import add_global_arguments
 from pdffiller.cli.boolean_action import BooleanAction
 from pdffiller.cli.command import pdffiller_command, PdfFillerArgumentParser
 from pdffiller.cli.once_argument import OnceArgument
-from pdffiller.exceptions import (
-    AbortExecution,
-    CommandLineError,
-    FileNotExistsError,
-    PdfFillerException,
-)
+from pdffiller.exceptions import AbortExecution, CommandLineError, PdfFillerException
 from pdffiller.io.output import PdfFillerOutput
 from pdffiller.pdf import Pdf
-from pdffiller.typing import Any, Dict, Union
+from pdffiller.typing import Any, Callable, Dict, Union
+from pdffiller.utils import check_file_exists, json_loads
 
 from ..exit_codes import ERROR_ENCOUNTERED
 
 
+@functools.lru_cache(maxsize=1024)
+def _html_unescape(value: str) -> str:
+    """Convert HTML character references of a string"""
+    import html  # pylint: disable=import-outside-toplevel
+
+    return html.unescape(value)
+
+
+def _unescape(value: Any) -> Any:
+    """Convert HTML character references of a string value, other values are kept as is"""
+    if isinstance(value, str) and "&" in value:
+        return _html_unescape(value)
+    return value
+
+
+def _read_data_file(path: str) -> Any:
+    """Read field/value pairs from a JSON or YAML data file"""
+    if path.endswith((".yaml", ".yml")):
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        # Use libyaml based loader when PyYAML has been built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "r", encoding="utf-8") as stream:
+            return yaml.load(stream, Loader=loader)
+
+    # JSON documents are parsed from raw bytes, without a text decoding pass
+    with open(path, "rb") as stream:
+        return json_loads(stream.read())
+
+
+def _load_input_data(loader: Callable[[], Any], source: str) -> Any:
+    """Load input data, the execution is aborted if the data cannot be loaded"""
+    try:
+        return loader()
+    except Exception as exg:  # pylint: disable=broad-except
+        PdfFillerOutput().error(f"Failed to load {source} : {exg}")
+        raise AbortExecution(ERROR_ENCOUNTERED) from exg
+
+
+def _fields_to_data(input_data: Any) -> Any:
+    """
+    Convert a list of fields with their name and value into field/value pairs,
+    other input data is kept as is
+    """
+    if isinstance(input_data, list) and (not input_data or isinstance(input_data[0], dict)):
+        return {
+            _unescape(field["name"]): _unescape(field["value"])
+            for field in input_data
+            if "name" in field and "value" in field
+        }
+    return input_data
+
+
 @pdffiller_command(
     group=None,
 )
@@ -84,7 +130,6 @@ def fill_form(parser: PdfFillerArgumentParser, *args: Any) -> Any:
 
     opts = parser.parse_args(*args)
 
-    output = PdfFillerOutput()
     if not opts.file:
         raise CommandLineError("no input file given")
 
@@ -94,49 +139,29 @@ def fill_form(parser: PdfFillerArgumentParser, *args: Any) -> Any:
     if not opts.data and not opts.input_data:
         raise CommandLineError("no data file path given")
 
+    check_file_exists(opts.file)
+
     input_data: Dict[str, Union[str, int, float, bool]] = {}
     if opts.input_data:
-        try:
-            input_data = json.loads(opts.input_data)
-        except Exception as exg:  # pylint: disable=broad-except
-            output.error("Failed to load json input data")
-            raise AbortExecution(ERROR_ENCOUNTERED) from exg
-    else:
-        if "-" != opts.data:
-            if not os.path.isfile(opts.file):
-                raise FileNotExistsError(opts.file)
-            if not os.path.isfile(opts.data):
-                raise FileNotExistsError(opts.data)
-
-            with open(opts.data, "r", encoding="utf-8") as stream:
-                try:
-                    if os.path.splitext(opts.data)[1] in [".yaml", ".yml"]:
-                        input_data = yaml.safe_load(stream)
-                    else:
-                        input_data = json.load(stream)
-                except Exception as exg:  # pylint: disable=broad-except
-                    output.error(f"Failed to load {opts.data} input data file")
-                    raise AbortExecution(ERROR_ENCOUNTERED) from exg
-        elif not os.isatty(sys.stdin.fileno()):
-            try:
-                input_data = json.load(sys.stdin)
-            except Exception as exg:  # pylint: disable=broad-except
-                output.error(f"Failed to load {opts.data} input data file : " + str(exg))
-                raise AbortExecution(ERROR_ENCOUNTERED) from exg
-
-    if isinstance(input_data, list) and isinstance(input_data[0], dict):
-        input_dict = {}
-        for field in input_data:
-            if "name" in field and "value" in field:
-                input_dict[html.unescape(field["name"])] = html.unescape(field["value"])
-        input_data = input_dict
+        input_data = _load_input_data(lambda: json_loads(opts.input_data), "json input data")
+    elif "-" != opts.data:
+        check_file_exists(opts.data)
+        input_data = _load_input_data(
+            lambda: _read_data_file(opts.data), f"{opts.data} input data file"
+        )
+    elif not os.isatty(sys.stdin.fileno()):
+        stdin = getattr(sys.stdin, "buffer", sys.stdin)
+        input_data = _load_input_data(lambda: json_loads(stdin.read()), "stdin input data")
+
+    input_data = _fields_to_data(input_data)
 
     try:
         pdf = Pdf(opts.file)
         pdf.fill(opts.file, opts.output, input_data, opts.flatten)
     except PdfFillerException as exp:
-        output.error(str(exp))
+        PdfFillerOutput().error(str(exp))
     except Exception as exg:  # pylint: disable=broad-except # pragma: no cover
-        output.error(f"unexpected error when adding {opts.file} with the following error:")
-        output.error(exg)
+        PdfFillerOutput().error(
+            f"unexpected error when adding {opts.file} with the following error:"
+        ).error(exg)
         raise AbortExecution(ERROR_ENCOUNTERED) from exg
@@ -1,16 +1,18 @@
-import json
-
 from pdffiller.io.output import cli_out_write
-from pdffiller.typing import Any
+from pdffiller.typing import Any, IO, Optional
+from pdffiller.utils import json_dumps
 
 
-def default_json_formatter(data: Any) -> None:
+def default_json_formatter(data: Any, out: Optional[IO[str]] = None) -> None:
     """Default JSON formatter"""
-    data_json = json.dumps(data, indent=4)
-    cli_out_write(data_json)
+    if isinstance(data, dict) and not data:
+        cli_out_write("{}", out=out)
+        return
+    cli_out_write(json_dumps(data), out=out)
 
 
-def default_text_formatter(data: Any) -> None:
+def default_text_formatter(data: Any, out: Optional[IO[str]] = None) -> None:
     """Default TEXT formatter"""
-    for key, value in data.items():
-        cli_out_write(f"{key}: {value}")
+    if not data:
+        return
+    cli_out_write("".join(f"{key}: {value}\n" for key, value in data.items()), endline="", out=out)
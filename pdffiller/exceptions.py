@@ -7,8 +7,10 @@ from pdffiller.typing import Optional, PathLike
 class PdfFillerException(Exception):
     """PdfFiller based exception object"""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
-        Exception.__init__(self, message)
+        super().__init__(message)
         self.message = message
 
 
@@ -20,40 +22,47 @@ class PdfFillerException(Exception):
 class AbortExecution(PdfFillerException):
     """Abort but with success the current execution"""
 
+    __slots__ = ("exitcode",)
+
     def __init__(self, exitcode: int = 0) -> None:
         self.exitcode = exitcode
-        PdfFillerException.__init__(self, "")
+        super().__init__("")
 
 
 class CommandLineError(PdfFillerException):
     """One command-line argument is not defined properly"""
 
-    def __init__(self, message: str) -> None:
-        PdfFillerException.__init__(self, message)
+    __slots__ = ()
 
 
 class InvalidCommandNameException(PdfFillerException):
     """Invalid command or action name"""
 
+    __slots__ = ()
+
     def __init__(self, name: Optional[str] = None) -> None:
         if name:
-            PdfFillerException.__init__(self, f"Unknown '{name}' command")
+            super().__init__(f"Unknown '{name}' command")
         else:
-            PdfFillerException.__init__(self, "No command name given")
+            super().__init__("No command name given")
 
 
 class InvalidSubCommandNameException(PdfFillerException):
     """Invalid sub-command name"""
 
+    __slots__ = ()
+
     def __init__(self, name: Optional[str] = None) -> None:
         if name:
-            PdfFillerException.__init__(self, f"Unknown '{name}' sub-command")
+            super().__init__(f"Unknown '{name}' sub-command")
         else:
-            PdfFillerException.__init__(self, "No sub-command name given")
+            super().__init__("No sub-command name given")
 
 
 class FileNotExistsError(PdfFillerException):
     """File not found"""
 
+    __slots__ = ()
+
     def __init__(self, pathname: PathLike) -> None:
-        PdfFillerException.__init__(self, f"{pathname} : file not found")
+        super().__init__(f"{pathname} : file not found")
@@ -7,7 +7,7 @@ from colorama import Fore, Style
 from pdffiller import const
 from pdffiller.exceptions import CommandLineError
 from pdffiller.io.colors import color_enabled, is_terminal
-from pdffiller.typing import Dict, Optional, Union
+from pdffiller.typing import Dict, IO, Optional, Union
 
 LEVEL_QUIET = 80  # -q
 LEVEL_ERROR = 70  # Errors
@@ -18,6 +18,21 @@ LEVEL_VERBOSE = 30  # -V  Detailed informational messages.
 LEVEL_DEBUG = 20  # -VV Closely related to internal implementation details
 LEVEL_TRACE = 10  # -VVV Fine-grained messages with very low-level implementation details
 
+_LEVELS_BY_NAME: Dict[Optional[str], int] = {
+    "quiet": LEVEL_QUIET,  # -Vquiet 80
+    "error": LEVEL_ERROR,  # -Verror 70
+    "warning": LEVEL_WARNING,  # -Vwaring 60
+    "notice": LEVEL_NOTICE,  # -Vnotice 50
+    "status": LEVEL_STATUS,  # -Vstatus 40
+    "info": LEVEL_STATUS,  # -Vstatus 40
+    None: LEVEL_VERBOSE,  # -V 30
+    "verbose": LEVEL_VERBOSE,  # -Vverbose 30
+    "debug": LEVEL_DEBUG,  # -Vdebug 20
+    "V": LEVEL_DEBUG,  # -VV 20
+    "trace": LEVEL_TRACE,  # -Vtrace 10
+    "VV": LEVEL_TRACE,  # -VVV 10
+}
+
 
 class Color:  # pylint: disable=too-few-public-methods
     """Wrapper around colorama colors that are undefined in importing"""
@@ -75,20 +90,7 @@ class PdfFillerOutput:
         :param level_name: `str` or `None`, where `None` is the same as `verbose`.
         """
         try:
-            level = {
-                "quiet": LEVEL_QUIET,  # -Vquiet 80
-                "error": LEVEL_ERROR,  # -Verror 70
-                "warning": LEVEL_WARNING,  # -Vwaring 60
-                "notice": LEVEL_NOTICE,  # -Vnotice 50
-                "status": LEVEL_STATUS,  # -Vstatus 40
-                "info": LEVEL_STATUS,  # -Vstatus 40
-                None: LEVEL_VERBOSE,  # -V 30
-                "verbose": LEVEL_VERBOSE,  # -Vverbose 30
-                "debug": LEVEL_DEBUG,  # -Vdebug 20
-                "V": LEVEL_DEBUG,  # -VV 20
-                "trace": LEVEL_TRACE,  # -Vtrace 10
-                "VV": LEVEL_TRACE,  # -VVV 10
-            }[level_name]
+            level = _LEVELS_BY_NAME[level_name]
         except KeyError:
             # pylint: disable=raise-missing-from
             raise CommandLineError(f"Invalid argument '-V{level_name}'")
@@ -321,15 +323,18 @@ def cli_out_write(
     back: Optional[str] = None,
     endline: str = "\n",
     indentation: int = 0,
+    out: Optional[IO[str]] = None,
 ) -> None:
     """
-    Output to be used by formatters to dump information to stdout
+    Output to be used by formatters to dump information to stdout,
+    or to the given ``out`` stream
     """
+    stream = out if out is not None else sys.stdout
     fore_ = fore or ""
     back_ = back or ""
-    if (fore or back) and color_enabled(sys.stdout):
+    if (fore or back) and color_enabled(stream):
         data = f"{' ' * indentation}{fore_}{back_}{data}{Style.RESET_ALL}{endline}"
     else:
         data = f"{' ' * indentation}{data}{endline}"
 
-    sys.stdout.write(data)
+    stream.write(data)
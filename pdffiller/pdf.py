@@ -10,9 +10,13 @@ The core class, `Pdf`, encapsulates a PDF document and provides
 methods for interacting with its form fields and content.
 """
 
-from collections import OrderedDict
+import functools
+import io
+import os
+import sys
+from pathlib import Path
 
-from pypdf import PdfReader, PdfWriter
+from pypdf import PageObject, PdfReader, PdfWriter
 from pypdf.errors import PyPdfError
 from pypdf.generic import (
     ArrayObject,
@@ -27,15 +31,19 @@ from pdffiller.io.output import PdfFillerOutput
 from .typing import (
     Any,
     Callable,
-    cast,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     PathLike,
+    Set,
     StrByteType,
+    Tuple,
     Type,
     Union,
 )
+from .utils import json_dumps
 from .widgets.base import Widget
 from .widgets.checkbox import CheckBoxWidget
 from .widgets.radio import RadioWidget
@@ -69,6 +77,132 @@ class PdfAttributes:  # pylint: disable=too-few-public-methods
     READ_ONLY = 1 << 0
 
 
+# Name objects used as keys when updating annotations, built once instead of on each access
+_NV = NameObject(PdfAttributes.V)
+_NAS = NameObject(PdfAttributes.AS)
+_NFF = NameObject(PdfAttributes.Ff)
+_NPARENT = NameObject(PdfAttributes.Parent)
+_NAP = NameObject(PdfAttributes.AP)
+_NOFF = NameObject(PdfAttributes.Off)
+
+# Masks used to set or clear the read only field flag
+_RO = PdfAttributes.READ_ONLY
+_NRO = ~PdfAttributes.READ_ONLY
+
+# Widget type resolvers by field type, called with the field flags
+_FIELD_TYPES: Dict[str, Callable[[int], str]] = {
+    PdfAttributes.Tx: lambda ff: "text",
+    PdfAttributes.Ch: lambda ff: "combo" if ff & 1 << 17 else "list",  # test 18th bit
+    PdfAttributes.Btn: lambda ff: "radio" if ff & 1 << 15 else "checkbox",  # test 16th bit
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _export_name(value: str) -> NameObject:
+    """Get the name object of an export value, recently used name objects are reused"""
+    return NameObject("/" + value)
+
+
+def _get_object(dictionary: Any, key: str) -> Any:
+    """
+    Look up an entry of a PDF dictionary with a single lookup.
+
+    Indirect objects are resolved, as item access does, the entry is None when missing.
+    """
+    value = dictionary.get(key)
+    if value is not None:
+        value = value.get_object()
+    return value
+
+
+def _file_stat(path: str) -> Optional[Tuple[int, int, int]]:
+    """Get a snapshot of a file telling whether it changed, None when it cannot be read"""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _fill_text(annotation: DictionaryObject, widget: TextWidget) -> None:
+    """
+    Updates the value of a text annotation, setting the text content.
+
+    This function modifies the value (V) and appearance (AP) of the text
+    annotation to reflect the new text content.
+
+    Args:
+        annotation (DictionaryObject): The text annotation dictionary.
+        widget (TextWidget): The Text widget object containing the text value.
+    """
+    if PdfAttributes.Parent in annotation and PdfAttributes.T not in annotation:
+        annotation[_NPARENT] = TextStringObject(widget.value)
+        annotation[_NAP] = TextStringObject(widget.value)
+    else:
+        annotation[_NV] = TextStringObject(widget.value)
+        annotation[_NAP] = TextStringObject(widget.value)
+
+
+def _fill_checkbox(annotation: DictionaryObject, widget: CheckBoxWidget) -> None:
+    value: Union[bool, str, None] = widget.value
+    if value is None:
+        value = False
+    if not isinstance(value, bool):
+        annotation[_NAS] = _export_name(widget.value)
+        annotation[_NV] = _export_name(widget.value)
+        return
+
+    appearances: Any = annotation[PdfAttributes.AP]
+    for each in appearances[PdfAttributes.N]:
+        if (value and str(each) != PdfAttributes.Off) or (
+            not value and str(each) == PdfAttributes.Off
+        ):
+            annotation[_NAS] = annotation[_NV] = each
+            return
+
+    if PdfAttributes.V in annotation:
+        del annotation[PdfAttributes.V]
+    if PdfAttributes.AS in annotation:
+        del annotation[PdfAttributes.AS]
+
+
+def _fill_radio(annotation: DictionaryObject, widget: RadioWidget) -> None:
+    target = f"/{widget.value}"
+    # the export value of a radio button is the name of its "on" appearance
+    appearances: Any = annotation[_NAP]
+    export = next(
+        (each for each in appearances[PdfAttributes.N] if each != PdfAttributes.Off), None
+    )
+    if export is not None and export == target:
+        annotation[_NAS] = export
+        field: Any = annotation if PdfAttributes.T in annotation else annotation[_NPARENT]
+        field[_NV] = export
+    else:
+        annotation[_NAS] = _NOFF
+
+
+def _set_read_only(field: DictionaryObject, val: bool) -> None:
+    """
+    Set or clear the ReadOnly flag of a field.
+
+    The flags are only written when they change, fields sharing a parent are
+    flattened through the same dictionary.
+    """
+    current = field.get(_NFF)
+    flags = int(current or 0)
+    new_flags = flags | _RO if val else flags & _NRO
+    if current is None or new_flags != flags:
+        field[_NFF] = NumberObject(new_flags)
+
+
+# Functions updating an annotation with the value of a widget, by widget type
+_FILLERS: Dict[str, Callable[[DictionaryObject, Any], None]] = {
+    TextWidget.field_type: _fill_text,
+    CheckBoxWidget.field_type: _fill_checkbox,
+    RadioWidget.field_type: _fill_radio,
+}
+
+
 class Pdf:
     """
     A class to wrap PDF form operations, providing a simplified interface
@@ -103,8 +237,13 @@ class Pdf:
         """
 
         super().__init__()
-        self.widgets: OrderedDict[str, Widget] = OrderedDict()
+        self.widgets: Dict[str, Widget] = {}
         self.adobe_mode = adode_mode
+        self._content: Optional[StrByteType] = None
+        self._content_path: Optional[str] = None
+        self._reader: Optional[PdfReader] = None
+        self._content_stat: Optional[Tuple[int, int, int]] = None
+        self._pages_with_widgets: Set[int] = set()
 
         self._init_helper(content)
 
@@ -124,86 +263,86 @@ class Pdf:
         if not content:
             return
 
-        loaded_widgets: OrderedDict[str, Widget] = OrderedDict()
+        loaded_widgets: Dict[str, Widget] = {}
+        pages_with_widgets: Set[int] = set()
+        # the file is looked up before being parsed, so that any later change is noticed
+        content_path = os.fspath(content) if isinstance(content, (str, Path)) else None
+        content_stat = _file_stat(content_path) if content_path is not None else None
         try:
             pdf_file = PdfReader(content)
         except PyPdfError as ex:
             PdfFillerOutput().error(str(ex))
             return
 
-        for i, page in enumerate(pdf_file.pages):
-            widgets: Optional[ArrayObject] = page.annotations
-            if not widgets:
+        # keep the parsed document to fill it without parsing the same content again
+        self._content = content
+        self._content_path = content_path
+        self._content_stat = content_stat
+        self._reader = pdf_file
+
+        # form fields belong to the interactive form, pages of a document without it
+        # hold no widget to load
+        pages = pdf_file.pages if PdfAttributes.AcroForm in pdf_file.root_object else ()
+        get_field_type = self._get_field_type
+        radio_fields: Set[int] = set()
+        for i, _, widget, key in self._iter_widgets(pages):
+            widget_type = get_field_type(widget)
+            if not widget_type:
                 continue
-            for widget in widgets:
-                choices: Optional[List[str]] = None
-                if (
-                    PdfAttributes.Subtype not in widget
-                    or widget[PdfAttributes.Subtype] != PdfAttributes.Widget
-                ):
-                    continue
-
-                if PdfAttributes.T not in widget:
-                    widget = widget[PdfAttributes.Parent]
-                key = self._get_widget_name(widget)
-                if not key:
-                    continue
-                widget_type: Optional[str] = self._get_field_type(widget)
-                if not widget_type:
-                    continue
 
-                value = widget[PdfAttributes.V] if PdfAttributes.V in widget else None
-                if widget_type == "radio":
-                    if value:
-                        value = value[1:]
-                    choices = []
-                    if PdfAttributes.Kids in widget:
-                        for each in widget[PdfAttributes.Kids]:
-                            for each in each[PdfAttributes.AP][PdfAttributes.N].keys():
-                                if each[1:] not in choices:
-                                    choices.append(each[1:])
-
-                elif widget_type == "checkbox":
-
-                    if (
-                        PdfAttributes.AP in widget
-                        and PdfAttributes.N in widget[PdfAttributes.AP]
-                        and PdfAttributes.D in widget[PdfAttributes.AP]
-                        and PdfAttributes.AS in widget
-                    ):
-                        choices = [
-                            each[1:] for each in (widget[PdfAttributes.AP][PdfAttributes.N]).keys()
-                        ]
-                        if "Off" not in choices:
-                            choices.insert(0, "Off")
-                elif widget_type in ["list", "combo"] and value:
-                    choices = [each[1:] for each in widget[PdfAttributes.Opt]]
-                if key not in loaded_widgets:
-                    new_widget = self.TYPE_TO_OBJECT[widget_type](key, i, value)
-                    if choices and isinstance(new_widget, CheckBoxWidget):
-                        new_widget.choices = choices
-                    elif isinstance(new_widget, TextWidget):
-                        max_length = (
-                            int(widget[PdfAttributes.MaxLen])
-                            if PdfAttributes.MaxLen in widget
-                            else None
+            choices: Optional[List[str]] = None
+            value = _get_object(widget, PdfAttributes.V)
+            if widget_type == "radio":
+                if value:
+                    value = value[1:]
+                choices = []
+                # kids of a radio group share the same field, its options are listed once
+                if PdfAttributes.Kids in widget and id(widget) not in radio_fields:
+                    radio_fields.add(id(widget))
+                    choices = list(
+                        dict.fromkeys(
+                            export[1:]
+                            for kid in widget[PdfAttributes.Kids]
+                            for export in kid[PdfAttributes.AP][PdfAttributes.N]
                         )
-                        if max_length:
-                            new_widget.max_length = max_length
-                    loaded_widgets[key] = new_widget
-                else:
-                    new_widget = loaded_widgets[key]
-                    if choices and isinstance(new_widget, CheckBoxWidget):
-                        for each in choices:
-                            if new_widget.choices is not None:
-                                if each not in new_widget.choices:
-                                    new_widget.choices.append(each)
-                            else:
-                                new_widget.choices = [each]
-
-                        cast(CheckBoxWidget, loaded_widgets[key]).choices = new_widget.choices
+                    )
+
+            elif widget_type == "checkbox":
+                appearances: Any = _get_object(widget, PdfAttributes.AP)
+                if (
+                    appearances is not None
+                    and PdfAttributes.N in appearances
+                    and PdfAttributes.D in appearances
+                    and PdfAttributes.AS in widget
+                ):
+                    choices = [each[1:] for each in appearances[PdfAttributes.N]]
+                    if "Off" not in choices:
+                        choices.insert(0, "Off")
+            elif widget_type in ["list", "combo"] and value:
+                choices = list(dict.fromkeys(each[1:] for each in widget[PdfAttributes.Opt]))
+            pages_with_widgets.add(i)
+            if key not in loaded_widgets:
+                new_widget = self.TYPE_TO_OBJECT[widget_type](key, i, value)
+                if choices and isinstance(new_widget, CheckBoxWidget):
+                    new_widget.choices = choices
+                elif isinstance(new_widget, TextWidget):
+                    max_length = widget.get(PdfAttributes.MaxLen)
+                    if max_length:
+                        new_widget.max_length = int(max_length)
+                loaded_widgets[key] = new_widget
+            else:
+                new_widget = loaded_widgets[key]
+                if choices and isinstance(new_widget, CheckBoxWidget):
+                    if new_widget.choices is None:
+                        new_widget.choices = []
+                    known = set(new_widget.choices)
+                    for each in choices:
+                        if each not in known:
+                            known.add(each)
+                            new_widget.choices.append(each)
 
         self.widgets = loaded_widgets
+        self._pages_with_widgets = pages_with_widgets
 
     @property
     def schema(self) -> List[Dict[str, Any]]:
@@ -217,9 +356,18 @@ class Pdf:
         Returns:
             dict: A dictionary representing the JSON schema of the PDF form.
         """
-
         return [widget.schema_definition for widget in self.widgets.values()]
 
+    @property
+    def schema_json(self) -> str:
+        """
+        Returns the JSON schema of the PDF form serialized as a JSON document.
+
+        Returns:
+            str: The JSON document of the schema.
+        """
+        return json_dumps(self.schema)
+
     def fill(
         self,
         input_file: StrByteType,
@@ -230,6 +378,9 @@ class Pdf:
         """
         Fill the PDF form with data from a dictionary.
 
+        The document parsed when the `Pdf` object was created is reused when `input_file`
+        is the content given to the constructor, or the path of the same file.
+
         Args:
             input_file (StrByteType): The template PDF, provided as either:
                 - str: The file path to the PDF.
@@ -244,170 +395,175 @@ class Pdf:
         Returns:
             Pdf: The `Pdf` object, allowing for method chaining.
         """
+        # keys may be str subclasses, such as strings read from another document
+        data = {
+            sys.intern(str(key)) if isinstance(key, str) else key: value
+            for key, value in data.items()
+        }
         for key, value in data.items():
             if key in self.widgets:
                 self.widgets[key].value = value
 
-        reader = PdfReader(input_file)
+        # pages are only known to hold no widget when the parsed template is reused
+        pages_with_widgets: Optional[Set[int]] = None
+        if self._reader is not None and self._is_content(input_file):
+            reader = self._reader
+            pages_with_widgets = self._pages_with_widgets
+        else:
+            reader = PdfReader(input_file)
         if self.adobe_mode:
-            if (
-                PdfAttributes.AcroForm in cast(Any, reader.trailer[PdfAttributes.Root])
-                and PdfAttributes.XFA
-                in cast(Any, reader.trailer[PdfAttributes.Root])[PdfAttributes.AcroForm]
-            ):
-                del cast(Any, reader.trailer[PdfAttributes.Root])[PdfAttributes.AcroForm][
-                    PdfAttributes.XFA
-                ]
+            root: Any = reader.trailer[PdfAttributes.Root]
+            if PdfAttributes.AcroForm in root and PdfAttributes.XFA in root[PdfAttributes.AcroForm]:
+                del root[PdfAttributes.AcroForm][PdfAttributes.XFA]
 
         writer = PdfWriter(reader)
         if self.adobe_mode:
             writer.set_need_appearances_writer()
 
-        fillers: Dict[str, Callable[[DictionaryObject, Any], None]] = {
-            "checkbox": self._fill_checkbox,
-            "text": self._fill_text,
-            "radio": self._fill_radio,
-        }
-
         output = PdfFillerOutput()
-        for page in writer.pages:
-            widgets: Optional[ArrayObject] = page.annotations
-            if not widgets:
+        for _, annotation, _, widget_key in self._iter_widgets(writer.pages, pages_with_widgets):
+            current_widget = self.widgets.get(widget_key)
+            if current_widget is None:
                 continue
-            for widget in widgets:
-                if (
-                    PdfAttributes.Subtype not in widget
-                    or widget[PdfAttributes.Subtype] != PdfAttributes.Widget
-                ):
-                    continue
-
-                annotation = cast(DictionaryObject, widget.get_object())
-                if PdfAttributes.T not in widget:
-                    widget = widget[PdfAttributes.Parent]
-                widget_key: Optional[str] = self._get_widget_name(widget)
-                if not widget_key or widget_key not in self.widgets:
-                    continue
 
-                widget_type: Optional[str] = self._get_field_type(widget)
-                if not widget_type:
-                    continue
-
-                if widget_type != "radio":
-                    self.flatten_generic(annotation, flatten)
-                else:
-                    self.flatten_radio(annotation, flatten)
+            # the type of the field has been resolved when the widget was loaded
+            widget_type = current_widget.field_type
+            if widget_type != "radio":
+                self.flatten_generic(annotation, flatten)
+            else:
+                self.flatten_radio(annotation, flatten)
 
-                if widget_key not in data or widget_type not in fillers:
-                    continue
+            if widget_key not in data or widget_type not in _FILLERS:
+                continue
 
-                current_widget = self.widgets[widget_key]
-                if current_widget.value is None:
-                    continue
+            if current_widget.value is None:
+                continue
 
-                output.debug(f"Filling {current_widget.name} with {current_widget.value}")
-                fillers[widget_type](annotation, current_widget)
+            output.debug(f"Filling {current_widget.name} with {current_widget.value}")
+            _FILLERS[widget_type](annotation, current_widget)
 
-        with open(output_file, "wb") as f:
-            writer.write(f)
+        # the document is serialized in memory, then written to the output file at once
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        Path(output_file).write_bytes(buffer.getbuffer())
+        if self._content_path is not None and os.fspath(output_file) == self._content_path:
+            # the template has been overwritten, it is parsed again on the next fill
+            self._reader = None
 
         return self
 
-    def _get_widget_name(self, widget: Any) -> Optional[str]:
-        if PdfAttributes.T not in widget:
-            return None
-        key: Optional[str] = widget[PdfAttributes.T]
-        if (
-            PdfAttributes.Parent in widget
-            and PdfAttributes.T in widget[PdfAttributes.Parent].get_object()
-            and widget[PdfAttributes.Parent].get_object()[PdfAttributes.T] != key
-        ):
-            key = f"{self._get_widget_name(widget[PdfAttributes.Parent].get_object())}.{key}"
-
-        return key
+    def _is_content(self, input_file: StrByteType) -> bool:
+        """
+        Tell whether an input is the unchanged content the widgets were loaded from.
 
-    def _get_field_type(self, annotation: Any) -> Optional[str]:
+        File paths are compared by value, so that the same file given through another
+        string or path object is recognized, as long as the file has not changed since
+        it was loaded.
         """
-        Determine widget type given its annotations.
+        if self._content_path is None:
+            return input_file is self._content
+        return (
+            isinstance(input_file, (str, Path))
+            and os.fspath(input_file) == self._content_path
+            and _file_stat(self._content_path) == self._content_stat
+        )
+
+    def _iter_widgets(
+        self, pages: Iterable[PageObject], page_indexes: Optional[Set[int]] = None
+    ) -> Iterator[Tuple[int, DictionaryObject, Any, str]]:
         """
-        ft = annotation[PdfAttributes.FT] if PdfAttributes.FT in annotation else None
-        ff = annotation[PdfAttributes.Ff] if PdfAttributes.Ff in annotation else None
-
-        if ft == PdfAttributes.Tx:
-            return "text"
-        if ft == PdfAttributes.Ch:
-            if ff and int(ff) & 1 << 17:  # test 18th bit
-                return "combo"
-            return "list"
-        if ft == PdfAttributes.Btn:
-            if ff and int(ff) & 1 << 15:  # test 16th bit
-                return "radio"
-            return "checkbox"
+        Iterate over the widget annotations of the pages.
 
-        return None
+        Annotations that are not widgets, or whose field has no name, are skipped.
 
-    @staticmethod
-    def _fill_text(annotation: DictionaryObject, widget: TextWidget) -> None:
+        Args:
+            pages (Iterable[PageObject]): The pages to walk.
+            page_indexes (Optional[Set[int]]): The indexes of the pages to walk, all the
+                pages are walked when not given.
+
+        Yields:
+            tuple: The page index, the annotation, its field and the field name.
         """
-        Updates the value of a text annotation, setting the text content.
+        if page_indexes is not None and not page_indexes:
+            return
 
-        This function modifies the value (V) and appearance (AP) of the text
-        annotation to reflect the new text content.
+        # parent field names are cached by object identity during a single walk
+        field_names: Dict[int, str] = {}
+        get_widget_name = self._get_widget_name
+        for i, page in enumerate(pages):
+            if page_indexes is not None and i not in page_indexes:
+                continue
+            annotations: Optional[ArrayObject] = page.annotations
+            if not annotations:
+                continue
+            for annotation in annotations:
+                if _get_object(annotation, PdfAttributes.Subtype) != PdfAttributes.Widget:
+                    continue
 
-        Args:
-            annotation (DictionaryObject): The text annotation dictionary.
-            widget (TextWidget): The Text widget object containing the text value.
-        """
-        if PdfAttributes.Parent in annotation and PdfAttributes.T not in annotation:
-            annotation[NameObject(PdfAttributes.Parent)] = TextStringObject(widget.value)
-            annotation[NameObject(PdfAttributes.AP)] = TextStringObject(widget.value)
-        else:
-            annotation[NameObject(PdfAttributes.V)] = TextStringObject(widget.value)
-            annotation[NameObject(PdfAttributes.AP)] = TextStringObject(widget.value)
+                annotation = annotation.get_object()
+                field = (
+                    annotation
+                    if PdfAttributes.T in annotation
+                    else annotation[PdfAttributes.Parent]
+                )
+                key = get_widget_name(field, field_names)
+                if not key:
+                    continue
 
-    @staticmethod
-    def _fill_checkbox(annotation: DictionaryObject, widget: CheckBoxWidget) -> None:
-        value: Union[bool, str, None] = widget.value
-        if value is None:
-            value = False
-        if not isinstance(value, bool):
-            annotation[NameObject(PdfAttributes.AS)] = NameObject("/" + widget.value)
-            annotation[NameObject(PdfAttributes.V)] = NameObject("/" + widget.value)
-            return
+                yield i, annotation, field, key
 
-        for each in cast(Any, annotation[PdfAttributes.AP])[PdfAttributes.N]:
-            if (value and str(each) != PdfAttributes.Off) or (
-                not value and str(each) == PdfAttributes.Off
-            ):
-                annotation[NameObject(PdfAttributes.AS)] = NameObject(each)
-                annotation[NameObject(PdfAttributes.V)] = NameObject(each)
-                return
+    def _get_widget_name(
+        self, widget: Any, field_names: Optional[Dict[int, str]] = None
+    ) -> Optional[str]:
+        """
+        Determine the full name of a field given its dictionary.
 
-        if PdfAttributes.V in annotation:
-            del annotation[PdfAttributes.V]
-        if PdfAttributes.AS in annotation:
-            del annotation[PdfAttributes.AS]
+        The partial names of the parent fields are walked up iteratively, until a parent
+        with a cached full name is met. The returned name is interned.
 
-    @staticmethod
-    def _fill_radio(annotation: DictionaryObject, widget: RadioWidget) -> None:
+        Args:
+            widget (Any): The field dictionary.
+            field_names (Optional[Dict[int, str]]): The full names of the parent fields
+                met during the current walk, by object identity. Names are not cached
+                across calls when not given.
+        """
+        key: Optional[str] = _get_object(widget, PdfAttributes.T)
+        if key is None:
+            return None
 
-        for each in (
-            cast(Any, annotation[PdfAttributes.Kids])
-            if PdfAttributes.T in annotation
-            else cast(Any, annotation[PdfAttributes.Parent])[PdfAttributes.Kids]
-        ):
-            # determine the export value of each kid
-            keys = each[PdfAttributes.AP][PdfAttributes.N].keys()
-            if PdfAttributes.Off in keys:
-                keys.remove(PdfAttributes.Off)
-            export = list(keys)[0] or None
-
-            if f"/{widget.value}" == export:
-                annotation[NameObject(PdfAttributes.AS)] = NameObject(export)
-                cast(Any, annotation[NameObject(PdfAttributes.Parent)])[
-                    NameObject(PdfAttributes.V)
-                ] = NameObject(export)
-            else:
-                annotation[NameObject(PdfAttributes.AS)] = NameObject(PdfAttributes.Off)
+        if field_names is None:
+            field_names = {}
+        parents: List[Tuple[Any, str]] = []
+        name: Optional[str] = None
+        child_key = key
+        parent = widget.get(PdfAttributes.Parent)
+        while parent is not None:
+            parent = parent.get_object()
+            parent_key = _get_object(parent, PdfAttributes.T)
+            if parent_key is None or parent_key == child_key:
+                break
+            name = field_names.get(id(parent))
+            if name is not None:
+                break
+            parents.append((parent, parent_key))
+            child_key = parent_key
+            parent = parent.get(PdfAttributes.Parent)
+
+        for parent, parent_key in reversed(parents):
+            name = parent_key if name is None else f"{name}.{parent_key}"
+            field_names[id(parent)] = name
+
+        # names are interned as they are used as lookup keys of widgets and data
+        return sys.intern(str(key) if name is None else f"{name}.{key}")
+
+    def _get_field_type(self, annotation: Any) -> Optional[str]:
+        """
+        Determine widget type given its annotations.
+        """
+        resolver = _FIELD_TYPES.get(_get_object(annotation, PdfAttributes.FT))
+        if resolver is None:
+            return None
+        return resolver(int(annotation.get(PdfAttributes.Ff, 0)))
 
     @staticmethod
     def flatten_radio(annot: DictionaryObject, val: bool) -> None:
@@ -424,34 +580,8 @@ class Pdf:
             annot (DictionaryObject): The radio button annotation dictionary.
             val (bool): True to flatten (make read-only), False to unflatten (make editable).
         """
-        if PdfAttributes.Parent in annot:
-            cast(Any, annot[NameObject(PdfAttributes.Parent)])[NameObject(PdfAttributes.Ff)] = (
-                NumberObject(
-                    (
-                        int(
-                            cast(Any, annot[NameObject(PdfAttributes.Parent)]).get(
-                                NameObject(PdfAttributes.Ff), 0
-                            )
-                        )
-                        | PdfAttributes.READ_ONLY
-                        if val
-                        else int(
-                            cast(Any, annot[NameObject(PdfAttributes.Parent)]).get(
-                                NameObject(PdfAttributes.Ff), 0
-                            )
-                        )
-                        & ~PdfAttributes.READ_ONLY
-                    )
-                )
-            )
-        else:
-            annot[NameObject(PdfAttributes.Ff)] = NumberObject(
-                (
-                    int(annot.get(NameObject(PdfAttributes.Ff), 0)) | PdfAttributes.READ_ONLY
-                    if val
-                    else int(annot.get(NameObject(PdfAttributes.Ff), 0)) & ~PdfAttributes.READ_ONLY
-                )
-            )
+        target: Any = annot[_NPARENT] if PdfAttributes.Parent in annot else annot
+        _set_read_only(target, val)
 
     @staticmethod
     def flatten_generic(annot: DictionaryObject, val: bool) -> None:
@@ -467,22 +597,9 @@ class Pdf:
             annot (DictionaryObject): The annotation dictionary.
             val (bool): True to flatten (make read-only), False to unflatten (make editable).
         """
-        if PdfAttributes.Parent in annot and PdfAttributes.Ff not in annot:
-            cast(Any, annot[NameObject(PdfAttributes.Parent)])[NameObject(PdfAttributes.Ff)] = (
-                NumberObject(
-                    (
-                        int(annot.get(NameObject(PdfAttributes.Ff), 0)) | PdfAttributes.READ_ONLY
-                        if val
-                        else int(annot.get(NameObject(PdfAttributes.Ff), 0))
-                        & ~PdfAttributes.READ_ONLY
-                    )
-                )
-            )
-        else:
-            annot[NameObject(PdfAttributes.Ff)] = NumberObject(
-                (
-                    int(annot.get(NameObject(PdfAttributes.Ff), 0)) | PdfAttributes.READ_ONLY
-                    if val
-                    else int(annot.get(NameObject(PdfAttributes.Ff), 0)) & ~PdfAttributes.READ_ONLY
-                )
-            )
+        target: Any = (
+            annot[_NPARENT]
+            if PdfAttributes.Parent in annot and PdfAttributes.Ff not in annot
+            else annot
+        )
+        _set_read_only(target, val)
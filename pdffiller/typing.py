@@ -8,11 +8,14 @@ from typing import (
     Generator,
     IO,
     ItemsView,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     overload,
     Sequence,
+    Set,
     Tuple,
     Type,
     TYPE_CHECKING,
@@ -31,11 +34,14 @@ __all__ = [
     "Generator",
     "IO",
     "ItemsView",
+    "Iterable",
+    "Iterator",
     "List",
     "Optional",
     "Mapping",
     "PathLike",
     "Sequence",
+    "Set",
     "Tuple",
     "TypedDict",
     "TypeVar",
@@ -1,7 +1,21 @@
 import os
+import stat
 from pathlib import Path
 
-from pdffiller.typing import Any, Optional, PathLike
+from pdffiller.exceptions import FileNotExistsError
+from pdffiller.typing import Any, Optional, PathLike, Union
+
+try:
+    import orjson
+
+    _ORJSON_DUMPS_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson  # type: ignore[import-untyped,unused-ignore]
+except ImportError:  # pragma: no cover
+    ujson = None  # type: ignore[assignment,unused-ignore]
 
 
 def str_to_path(path: Optional[PathLike]) -> Any:
@@ -34,3 +48,69 @@ def path_to_str(path: Optional[PathLike]) -> Any:
         return None
 
     return os.fspath(path)
+
+
+def check_file_exists(path: PathLike) -> None:
+    """Ensure a path refers to an existing regular file
+
+    :param path: The path to be checked
+    :raise FileNotExistsError: if ``path`` is not an existing regular file
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError) as exc:
+        raise FileNotExistsError(path) from exc
+
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotExistsError(path)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document
+
+    orjson is used when it is installed, then ujson, else the standard json module.
+
+    :param data: The JSON document
+    :return: The deserialized data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+
+    import json  # pylint: disable=import-outside-toplevel
+
+    return json.loads(data)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert the values orjson does not serialize natively, such as float subclasses
+
+    :param obj: The value to be converted
+    :return: The converted value
+    :raise TypeError: if the value cannot be serialized
+    """
+    if isinstance(obj, float):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data as an indented JSON document
+
+    orjson is used when it is installed, then ujson, else the standard json module.
+    Whatever the backend, the document is indented with 2 spaces and non-ASCII
+    characters are kept as is.
+
+    :param data: The data to be serialized
+    :return: The JSON document
+    """
+    if orjson is not None:
+        document = orjson.dumps(data, default=_orjson_default, option=_ORJSON_DUMPS_OPTIONS)
+        return document.decode("utf-8")
+    if ujson is not None:
+        return ujson.dumps(data, indent=2, ensure_ascii=False, escape_forward_slashes=False)
+
+    import json  # pylint: disable=import-outside-toplevel
+
+    return json.dumps(data, indent=2, ensure_ascii=False)
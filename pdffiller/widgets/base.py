@@ -20,6 +20,10 @@ class Widget:
     as name, value, and schema definition.
     """
 
+    __slots__ = ("_name", "page_number", "_value", "_description")
+
+    field_type: str = ""
+
     def __init__(self, name: str, page_number: int, value: Optional[Any] = None) -> None:
         """
         Initialize a new widget.
@@ -97,11 +101,26 @@ class Widget:
         Returns:
             dict: The schema definition of the widget.
         """
-        result: Dict[str, Any] = {"FieldName": self._name}
+        return self._extend_schema_definition({})
+
+    def _extend_schema_definition(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add the common entries of the widget to a schema definition.
+
+        Subclasses give their own leading entries, so that a single dictionary
+        is built for each schema definition.
+
+        Args:
+            schema (dict): The schema definition to extend.
+
+        Returns:
+            dict: The extended schema definition.
+        """
+        schema["FieldName"] = self._name
         if self._value:
-            result["FieldValue"] = self._value
+            schema["FieldValue"] = self._value
 
         if self._description is not None:
-            result["Description"] = self._description
+            schema["Description"] = self._description
 
-        return result
+        return schema
@@ -19,6 +19,10 @@ class CheckBoxWidget(Widget):
     implements the schema_definition and sample_value properties.
     """
 
+    __slots__ = ("choices",)
+
+    field_type = "checkbox"
+
     def __init__(
         self,
         name: str,
@@ -49,4 +53,6 @@ class CheckBoxWidget(Widget):
         Returns:
             dict: A dictionary representing the schema definition.
         """
-        return {"FieldType": "checkbox", "FieldOptions": self.choices, **super().schema_definition}
+        return self._extend_schema_definition(
+            {"FieldType": "checkbox", "FieldOptions": self.choices}
+        )
@@ -20,6 +20,10 @@ class RadioWidget(CheckBoxWidget):
     the schema_definition and sample_value properties.
     """
 
+    __slots__ = ()
+
+    field_type = "radio"
+
     @property
     def schema_definition(self) -> Dict[str, Any]:
         """
@@ -31,7 +35,4 @@ class RadioWidget(CheckBoxWidget):
         Returns:
             dict: A dictionary representing the schema definition.
         """
-        return {
-            **super().schema_definition,
-            "FieldType": "radio",
-        }
+        return self._extend_schema_definition({"FieldType": "radio", "FieldOptions": self.choices})
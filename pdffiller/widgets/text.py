@@ -20,6 +20,10 @@ class TextWidget(Widget):
     the value, schema_definition.
     """
 
+    __slots__ = ("max_length",)
+
+    field_type = "text"
+
     def __init__(
         self,
         name: str,
@@ -75,7 +79,7 @@ class TextWidget(Widget):
         Returns:
             dict: A dictionary representing the schema definition.
         """
-        schema: Dict[str, Any] = {"FieldType": "text", **super().schema_definition}
+        schema = self._extend_schema_definition({"FieldType": "text"})
         if self.max_length:
             schema["MaxLength"] = self.max_length
 
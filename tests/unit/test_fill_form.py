@@ -0,0 +1,67 @@
+import pytest
+
+from pdffiller.cli.cli import Cli
+from pdffiller.cli.commands import fill_form
+from pdffiller.exceptions import AbortExecution, FileNotExistsError
+from pdffiller.pdf import Pdf
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ([], {}),
+        (
+            [
+                {"name": "Lastname", "value": "D&amp;oe"},
+                {"name": "Age", "value": 42},
+                {"name": "Single", "value": True},
+                {"name": "Ignored"},
+            ],
+            {"Lastname": "D&oe", "Age": 42, "Single": True},
+        ),
+        ({"Lastname": "D&amp;oe"}, {"Lastname": "D&amp;oe"}),
+    ],
+)
+def test_fields_to_data(data, expected):
+    """test fields given as a list are converted into field/value pairs"""
+    assert fill_form._fields_to_data(data) == expected
+
+
+@pytest.mark.parametrize(
+    "name,content",
+    [
+        ("data.json", '{"Lastname": "Doe", "Age": 42}'),
+        ("data.yaml", "Lastname: Doe\nAge: 42\n"),
+    ],
+)
+def test_read_data_file(tmp_path, name, content):
+    """test json and yaml data files are loaded"""
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    assert fill_form._read_data_file(str(path)) == {"Lastname": "Doe", "Age": 42}
+
+
+def test_load_input_data_abort(tmp_path, capsys):
+    """test the execution is aborted when the input data cannot be loaded"""
+    path = str(tmp_path / "data.json")
+    with pytest.raises(AbortExecution) as exc:
+        fill_form._load_input_data(lambda: fill_form._read_data_file(path), "data file")
+    assert exc.value.exitcode != 0
+    err = capsys.readouterr().err
+    assert "Failed to load data file : " in err
+    assert "No such file or directory" in err
+
+
+def test_fill_form_missing_input_file(tmp_path):
+    """test the input PDF is checked whatever the data source"""
+    output_file = str(tmp_path / "output.pdf")
+    with pytest.raises(FileNotExistsError):
+        Cli().run(["fill_form", str(tmp_path / "missing.pdf"), "-o", output_file, "-i", "{}"])
+
+
+def test_fill_form_fields_list(test_data_dir, tmp_path):
+    """test fields given as a list on the command line are filled"""
+    output_file = tmp_path / "output.pdf"
+    data = '[{"name": "Lastname", "value": "Doe"}]'
+    Cli().run(["fill_form", str(test_data_dir / "input.pdf"), "-o", str(output_file), "-i", data])
+    assert Pdf(str(output_file)).schema[0]["FieldValue"] == "Doe"
@@ -1,6 +1,12 @@
+import shutil
+from pathlib import Path
+
 import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DictionaryObject, NameObject, TextStringObject
 
 from pdffiller.pdf import Pdf
+from pdffiller.widgets.text import TextWidget
 
 
 def test_valid_pdf(test_data_dir):
@@ -22,3 +28,142 @@ def test_valid_pdf(test_data_dir):
 def test_invalid_pdf(test_data_dir):
     reader = Pdf(str(test_data_dir / "empty.pdf"))
     assert len(reader.widgets) == 0
+
+
+def test_pdf_without_form(tmp_path):
+    input_file = tmp_path / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    writer.write(input_file)
+    reader = Pdf(str(input_file))
+    assert len(reader.widgets) == 0
+    assert reader.schema == []
+
+
+def test_fill_reuses_parsed_pdf(test_data_dir, tmp_path):
+    input_file = str(test_data_dir / "input.pdf")
+    output_file = tmp_path / "output.pdf"
+    pdf = Pdf(input_file)
+    reader = pdf._reader
+    # the same file given as a path object is recognized
+    pdf.fill(Path(input_file), output_file, {"Lastname": "Doe", "Firstname": "John"}, False)
+    assert pdf._reader is reader
+    assert pdf.schema[0]["FieldValue"] == "Doe"
+    schema = Pdf(str(output_file)).schema
+    assert schema[0]["FieldValue"] == "Doe"
+    assert schema[1]["FieldValue"] == "John"
+
+
+def test_fill_radio(test_data_dir, tmp_path):
+    input_file = str(test_data_dir / "input.pdf")
+    output_file = tmp_path / "output.pdf"
+    Pdf(input_file).fill(input_file, output_file, {"MaritalStatus": "Divorced"}, False)
+    schema = Pdf(str(output_file)).schema
+    assert schema[4]["FieldName"] == "MaritalStatus"
+    assert schema[4]["FieldValue"] == "Divorced"
+
+
+def _field(name, parent=None):
+    field = DictionaryObject()
+    if name is not None:
+        field[NameObject("/T")] = TextStringObject(name)
+    if parent is not None:
+        field[NameObject("/Parent")] = parent
+    return field
+
+
+def test_hierarchical_field_names():
+    pdf = Pdf()
+    root = _field("root")
+    group = _field("group", root)
+    assert pdf._get_widget_name(_field("first", group)) == "root.group.first"
+    assert pdf._get_widget_name(_field("second", group)) == "root.group.second"
+    assert pdf._get_widget_name(_field("group", group)) == "group"
+    assert pdf._get_widget_name(_field("orphan", _field(None, root))) == "orphan"
+    assert pdf._get_widget_name(_field(None, group)) is None
+
+
+def test_field_names_cached_per_walk():
+    pdf = Pdf()
+    group = _field("group", _field("root"))
+    field_names = {}
+    assert pdf._get_widget_name(_field("first", group), field_names) == "root.group.first"
+    assert field_names[id(group)] == "root.group"
+    # names of another walk are not looked up
+    assert pdf._get_widget_name(_field("first", _field("other"))) == "other.first"
+
+
+def test_indirect_field_value(test_data_dir, tmp_path):
+    input_file = tmp_path / "indirect.pdf"
+    writer = PdfWriter(clone_from=str(test_data_dir / "input.pdf"))
+    for annotation in writer.pages[0].annotations:
+        annotation = annotation.get_object()
+        if annotation.get("/T") == "Lastname":
+            annotation[NameObject("/V")] = writer._add_object(TextStringObject("Doe"))
+    writer.write(input_file)
+    pdf = Pdf(str(input_file))
+    assert pdf.schema[0]["FieldValue"] == "Doe"
+    assert '"FieldValue": "Doe"' in pdf.schema_json
+
+
+def test_schema_follows_widget_changes(test_data_dir):
+    pdf = Pdf(str(test_data_dir / "input.pdf"))
+    assert "FieldValue" not in pdf.schema[0]
+    pdf.widgets["Lastname"].value = "Changed"
+    assert pdf.schema[0]["FieldValue"] == "Changed"
+    pdf.widgets["Lastname"].description = "Last name"
+    assert pdf.schema[0]["Description"] == "Last name"
+    pdf.widgets["Lastname"].max_length = 12
+    assert pdf.schema[0]["MaxLength"] == 12
+    pdf.widgets["MaritalStatus"].choices.append("Widowed")
+    assert pdf.schema[4]["FieldOptions"][-1] == "Widowed"
+    pdf.widgets["Firstname"] = TextWidget("Firstname", 0, "John")
+    assert pdf.schema[1]["FieldValue"] == "John"
+    assert '"MaxLength": 12' in pdf.schema_json
+    assert '"Widowed"' in pdf.schema_json
+    # the schema is not shared between accesses
+    pdf.schema[0]["FieldValue"] = "Edited"
+    assert pdf.schema[0]["FieldValue"] == "Changed"
+
+
+def test_fill_in_place_twice(test_data_dir, tmp_path):
+    input_file = str(tmp_path / "input.pdf")
+    shutil.copyfile(test_data_dir / "input.pdf", input_file)
+    pdf = Pdf(input_file)
+    pdf.fill(input_file, input_file, {"Lastname": "Doe"}, False)
+    pdf.fill(input_file, input_file, {"Firstname": "John"}, False)
+    schema = Pdf(input_file).schema
+    assert schema[0]["FieldValue"] == "Doe"
+    assert schema[1]["FieldValue"] == "John"
+
+
+def test_fill_replaced_template(test_data_dir, tmp_path):
+    input_file = str(tmp_path / "input.pdf")
+    output_file = tmp_path / "output.pdf"
+    shutil.copyfile(test_data_dir / "input.pdf", input_file)
+    pdf = Pdf(input_file)
+    Pdf(str(test_data_dir / "input.pdf")).fill(input_file, input_file, {"Lastname": "Doe"}, False)
+    pdf.fill(input_file, output_file, {"Firstname": "John"}, False)
+    schema = Pdf(str(output_file)).schema
+    assert schema[0]["FieldValue"] == "Doe"
+    assert schema[1]["FieldValue"] == "John"
+
+
+def test_fill_in_place_by_path(test_data_dir, tmp_path):
+    input_file = tmp_path / "input.pdf"
+    shutil.copyfile(test_data_dir / "input.pdf", input_file)
+    pdf = Pdf(str(input_file))
+    pdf.fill(input_file, input_file, {"Lastname": "Doe"}, False)
+    assert not pdf._is_content(str(input_file))
+    pdf.fill(str(input_file), str(input_file), {"Firstname": "John"}, False)
+    schema = Pdf(str(input_file)).schema
+    assert schema[0]["FieldValue"] == "Doe"
+    assert schema[1]["FieldValue"] == "John"
+
+
+def test_fill_pdf_string_keys(test_data_dir, tmp_path):
+    input_file = str(test_data_dir / "input.pdf")
+    output_file = tmp_path / "output.pdf"
+    data = {TextStringObject("Lastname"): "Doe"}
+    Pdf(input_file).fill(input_file, output_file, data, False)
+    assert Pdf(str(output_file)).schema[0]["FieldValue"] == "Doe"
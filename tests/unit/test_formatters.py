@@ -1,38 +1,53 @@
+import io
+
 import pytest
 
 from pdffiller import exceptions
 from pdffiller.cli import formatters
 
 
-def test_default_json(capsys):
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({}, "{}\n"),
+        ({"key": "value", "second": "val"}, '{\n  "key": "value",\n  "second": "val"\n}\n'),
+    ],
+)
+def test_default_json(data, expected):
     """test default json formatter"""
-    formatters.default_json_formatter({})
-    assert (
-        capsys.readouterr().out
-        == """{}
-"""
-    )
-
-    formatters.default_json_formatter({"key": "value", "second": "val"})
-    assert (
-        capsys.readouterr().out
-        == """{
-    "key": "value",
-    "second": "val"
-}
-"""
-    )
-
-
-def test_default_text(capsys):
+    out = io.StringIO()
+    formatters.default_json_formatter(data, out=out)
+    assert out.getvalue() == expected
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({}, ""),
+        ({"key": "value", "second": "val"}, "key: value\nsecond: val\n"),
+    ],
+)
+def test_default_text(data, expected):
     """test default text formatter"""
-    formatters.default_text_formatter({})
-    assert capsys.readouterr().out == """"""
-
-    formatters.default_text_formatter({"key": "value", "second": "val"})
-    assert (
-        capsys.readouterr().out
-        == """key: value
-second: val
-"""
-    )
+    out = io.StringIO()
+    formatters.default_text_formatter(data, out=out)
+    assert out.getvalue() == expected
+
+
+def test_default_stdout(capsys):
+    """test formatters default to standard output"""
+    formatters.default_text_formatter({"key": "value"})
+    assert capsys.readouterr().out == "key: value\n"
+
+
+class _FalsyStream(io.StringIO):
+    def __bool__(self):
+        return False
+
+
+def test_default_falsy_stream(capsys):
+    """test a given stream is used even when it evaluates false"""
+    out = _FalsyStream()
+    formatters.default_text_formatter({"key": "value"}, out=out)
+    assert out.getvalue() == "key: value\n"
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from pypdf.generic import (
+    ArrayObject,
+    FloatObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
+
+from pdffiller import utils
+from pdffiller.exceptions import FileNotExistsError
+from pdffiller.pdf import Pdf
+from pdffiller.utils import check_file_exists, json_dumps, json_loads
+
+
+def test_check_file_exists(test_data_dir):
+    """test an existing regular file is accepted"""
+    check_file_exists(str(test_data_dir / "input.pdf"))
+
+
+@pytest.mark.parametrize("name", ["missing.pdf", "."])
+def test_check_file_not_exists(tmp_path, name):
+    """test missing files and directories are rejected"""
+    with pytest.raises(FileNotExistsError, match="file not found"):
+        check_file_exists(str(tmp_path / name))
+
+
+def test_json_dumps_pdf_objects():
+    """test numbers read from a PDF document are serialized as plain numbers"""
+    data = {"MaxLength": NumberObject(12), "FieldValue": FloatObject(12.5)}
+    assert json_dumps(data) == '{\n  "MaxLength": 12,\n  "FieldValue": 12.5\n}'
+
+
+@pytest.fixture(name="json_backend", params=["orjson", "ujson", "json"])
+def fixture_json_backend(request, monkeypatch):
+    """Select the JSON backend used by the utils helpers"""
+    backend = request.param
+    if backend != "json" and getattr(utils, backend) is None:
+        pytest.skip(f"{backend} is not installed")
+    if backend != "orjson":
+        monkeypatch.setattr(utils, "orjson", None)
+    if backend == "json":
+        monkeypatch.setattr(utils, "ujson", None)
+    return backend
+
+
+def _pdf_objects():
+    return {
+        "FieldName": TextStringObject("Nom/Prénom"),
+        "FieldValue": NameObject("/Off"),
+        "FieldOptions": ArrayObject([NameObject("/On"), TextStringObject("Été")]),
+        "MaxLength": NumberObject(12),
+        "Ratio": FloatObject(0.1),
+    }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"key": "value", "second": "val"},
+        {"path": "a/b", "text": "éà中", "list": [1, 2.5, True, None]},
+        _pdf_objects(),
+    ],
+)
+def test_json_dumps_backends(json_backend, data):
+    """test every backend gives the same document as the standard json module"""
+    assert json_dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_json_dumps_schema_backends(json_backend, test_data_dir):
+    """test every backend gives the same schema document as the standard json module"""
+    schema = Pdf(str(test_data_dir / "input.pdf")).schema
+    assert json_dumps(schema) == json.dumps(schema, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("data", ['{"key": "é/b", "list": [1, 2.5]}', b'{"key": "\\u00e9"}'])
+def test_json_loads_backends(json_backend, data):
+    """test every backend loads the same data as the standard json module"""
+    assert json_loads(data) == json.loads(data)